@@ -4,13 +4,27 @@ import os
 import sys
 import time
 from collections.abc import Callable
+from functools import partial
 from typing import override
 
 import fluidsynth
 import keyboard
 import mido
-from PySide6.QtCore import QRect, QSize, QThread, QTimer, Signal, Slot
-from PySide6.QtGui import QAction, QGuiApplication, Qt
+from PySide6.QtCore import (
+    QMetaObject,
+    QMutex,
+    QMutexLocker,
+    QObject,
+    QRect,
+    QSize,
+    QThread,
+    QThreadPool,
+    QTimer,
+    QWaitCondition,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QAction, QCloseEvent, QGuiApplication, Qt
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -31,26 +45,47 @@ from src.ui.buttons.play import PlayButton
 from src.ui.buttons.previous import PreviousButton
 from src.ui.playlist import PlayList
 from src.ui.progressbar import ProgressBar
+from src.ui.style import APP_STYLE_SHEET
 from src.ui.toggle_switch import ToggleSwitch
 from src.ui.volume_slider import Volume
-from src.utils.wwm_macro import play_chord
+from src.utils.win32 import pro_audio_thread, timer_resolution
+from src.utils.wwm_macro import play_chord, resolve_scan_codes
+
+SPIN_SECONDS: float = 0.002
+PROGRESS_SECONDS: float = 0.25
+PROGRESS_MILLISECONDS: int = int(PROGRESS_SECONDS * 1_000)
+WWM_LEAD_IN_SECONDS: float = 1.0
+MAX_LAG_SECONDS: float = 0.05
+NOTE_TYPES: frozenset[str] = frozenset(("note_on", "note_off"))
+
+NoteHandler = Callable[[int, int], None]
+ChordFlush = Callable[[], None]
+ScheduledEvent = tuple[float, NoteHandler, int, int]
 
 
 class Worker(QThread):
     """MIDI player worker."""
 
     duration_ready: Signal = Signal(float)
+    progress: Signal = Signal(float)
 
-    def __init__(self, filename: str, soundfont: str, is_audio: bool=False) -> None:
+    def __init__(self, filename: str, synth: fluidsynth.Synth, soundfont_id: int,
+                       is_audio: bool=False) -> None:
         """Initialize worker."""
         super().__init__()
         self.__error: bool = False
         self.__is_audio: bool = is_audio
         self.__filename: str = filename
-        self.__soundfont: str = soundfont
+        self.__synth: fluidsynth.Synth = synth
+        self.__soundfont_id: int = soundfont_id
         self.__running: bool = True
         self.__paused: bool = False
+        self.__interrupted: bool = False
+        self.__pause_mutex: QMutex = QMutex()
+        self.__pause_condition: QWaitCondition = QWaitCondition()
         self.__volume: int = 100
+        self.__last_volume: int = -1
+        self.__progress_time: float = 0.0
 
     @property
     def paused(self) -> bool:
@@ -62,134 +97,257 @@ class Worker(QThread):
         """Return error state."""
         return self.__error
 
-    def __build_tempo_map(self, midi: mido.MidiFile) -> list[tuple[int, int]]:
-        """Return a list of (abs_tick, tempo_microsec_per_beat), sorted by abs_tick.
+    def __scan_tracks(self, midi: mido.MidiFile) -> tuple[list[tuple[int, int]], int]:
+        """Return tempo map and max end tick collected in a single pass over the tracks.
 
+        Tempo map is a list of (abs_tick, tempo_microsec_per_beat), sorted by abs_tick.
         Default tempo is 500_000 (120 BPM). Tempo messages are taken from all tracks,
-        but commonly live in track 0.
+        but commonly live in track 0. Max end tick is the end of the longest track
+        containing notes.
         """
-        tempo_map: list[tuple[int, int]] = [(0, 500_000)]
-        for track in midi.tracks:
-            abs_ticks: int = 0
-            for msg in track:
-                abs_ticks += msg.time
-                if "set_tempo" == msg.type:
-                    tempo_map.append((abs_ticks, msg.tempo))
-        clean_tempo_map: dict[int, int] = {}
-        for tick, tempo in tempo_map:
-            clean_tempo_map[tick] = tempo
-        return sorted(clean_tempo_map.items())
-
-    def __find_max_end_tick(self, midi: mido.MidiFile) -> int:
-        """Find max end tick value."""
+        tempo_map: dict[int, int] = {0: 500_000}
         max_end_tick: int = 0
         for track in midi.tracks:
             abs_ticks: int = 0
             has_notes: bool = False
             for msg in track:
                 abs_ticks += msg.time
-                if msg.type in ("note_on", "note_off"):
+                msg_type: str = msg.type
+                if msg_type in NOTE_TYPES:
                     has_notes = True
+                elif "set_tempo" == msg_type:
+                    tempo_map[abs_ticks] = msg.tempo
             if has_notes:
                 max_end_tick = max(max_end_tick, abs_ticks)
-        return max_end_tick
+        return sorted(tempo_map.items()), max_end_tick
 
     def __ticks_to_seconds(self, midi: mido.MidiFile, max_end_tick: int,
                                  tempo_map: list[tuple[int, int]]) -> float:
-        """Convert an absolute tick position to seconds by walking the tempo segments."""
-        ticks_per_beat: int = midi.ticks_per_beat
-        total_seconds: float = 0.0
-        previous_tick, previous_tempo = tempo_map[0]
-        for tick, tempo in tempo_map[1:]:
-            segment_end: int = min(max_end_tick, tick)
-            if segment_end > previous_tick:
-                segment_ticks: int = segment_end - previous_tick
-                total_seconds += mido.tick2second(segment_ticks, ticks_per_beat, previous_tempo)
-                previous_tick = segment_end
-            if max_end_tick <= tick:
-                return total_seconds
-            previous_tempo = tempo
-        if max_end_tick > previous_tick:
-            segment_ticks: int = max_end_tick - previous_tick
-            total_seconds += mido.tick2second(segment_ticks, ticks_per_beat, previous_tempo)
-        return total_seconds
-
-    def __calculate_duration(self) -> None:
-        """Calculate overall duration."""
-        midi: mido.MidiFile = mido.MidiFile(self.__filename)
-        tempo_map: list[tuple[int, int]] = self.__build_tempo_map(midi)
-        max_end_tick: int = self.__find_max_end_tick(midi)
+        """Convert an absolute tick position to seconds by walking the tempo segments.
+
+        Each tempo segment ends where the next one starts, the last one at the max end tick.
+        Segment lengths are clamped to the max end tick, and their integer `ticks * tempo`
+        products are summed in one pass. The only float operation is the final division
+        by ticks per beat and microseconds per second.
+        """
+        boundaries: list[int] = [tick for tick, _ in tempo_map[1:]]
+        boundaries.append(max_end_tick)
+        total_microticks: int = sum(max(0, min(end, max_end_tick) - start) * tempo
+                                    for (start, tempo), end in zip(tempo_map, boundaries))
+        return total_microticks / (midi.ticks_per_beat * 1_000_000)
+
+    def __calculate_duration(self, midi: mido.MidiFile) -> None:
+        """Calculate overall duration of already parsed MIDI file.
+
+        Runs on the global thread pool, so the duration is delivered to the UI while the
+        playback thread is already building the schedule and playing.
+        """
+        tempo_map, max_end_tick = self.__scan_tracks(midi)
         self.duration_ready.emit(self.__ticks_to_seconds(midi, max_end_tick, tempo_map))
 
-    def __add_note(self, synth: fluidsynth.Synth, msg: mido.Message, chord_notes: list[int],
-                         velocities: list[int]) -> None:
-        """Add note details."""
-        if "note_on" == msg.type and 0 < msg.velocity:
-            chord_notes.append(msg.note)
-            velocities.append(msg.velocity)
-        elif "note_off" == msg.type and self.__is_audio:
-            synth.noteoff(0, msg.note)
-
-    def __flush_tick_events(self, synth: fluidsynth.Synth, tick_events: list[mido.Message]) -> None:
-        """Flush tick events."""
-        if not tick_events:
-            return
-        chord_notes: list[int] = []
-        velocities: list[int] = []
-        for msg in tick_events:
-            self.__add_note(synth, msg, chord_notes, velocities)
-        if chord_notes:
-            if self.__is_audio:
-                chord_velocity: int = max(velocities) if velocities else 64
+    def __build_schedule(self, midi: mido.MidiFile,
+                               handlers: dict[str, NoteHandler]) -> list[ScheduledEvent]:
+        """Return playable notes paired with their absolute time in seconds and handler.
+
+        Tracks are merged once and tempo changes are applied while walking the merged
+        track, so playback does not depend on `mido.MidiFile.play` sleeping between events.
+        Note-on messages with zero velocity are treated as note-off messages. Meta messages
+        and messages without a handler (note-off messages in WWM mode) are dropped here,
+        leaving the realtime loop with playable events only. Event times are accumulated
+        as integer `ticks * tempo` products, the same way the duration is, so timestamps
+        do not drift on long files and the last event lines up with the displayed duration.
+        Only the note number and velocity of each message are kept, so the realtime loop
+        reads no message attributes.
+        """
+        microticks_per_second: int = midi.ticks_per_beat * 1_000_000
+        tempo: int = 500_000
+        microticks: int = 0
+        schedule: list[ScheduledEvent] = []
+        for msg in mido.merge_tracks(midi.tracks):
+            microticks += msg.time * tempo
+            msg_type: str = msg.type
+            if "set_tempo" == msg_type:
+                tempo = msg.tempo
+                continue
+            if "note_on" == msg_type and 0 == msg.velocity:
+                msg_type = "note_off"
+            if handler := handlers.get(msg_type):
+                schedule.append((microticks / microticks_per_second, handler, msg.note,
+                                 msg.velocity))
+        return schedule
+
+    def __wait_for_resume(self, start_time: float) -> float:
+        """Block while paused, return start time shifted by the time spent on pause."""
+        paused_at: float = time.perf_counter()
+        with QMutexLocker(self.__pause_mutex):
+            while self.__paused and self.__running:
+                self.__pause_condition.wait(self.__pause_mutex)
+        return start_time + time.perf_counter() - paused_at
+
+    def __wait_until(self, start_time: float, event_time: float) -> float:
+        """Wait until event is due, honouring pause and stop requests.
+
+        Sleeps on the pause condition while at least a whole millisecond is left before
+        the event is SPIN_SECONDS away, then spins for the rest without touching the
+        mutex. Pause and stop requests wake the sleep right away and raise a single
+        interrupted flag, so the common unpaused path tests one attribute per step.
+        Sleeps are capped at PROGRESS_SECONDS and the playback position is reported after
+        each of them, so progress keeps moving through rests and long notes. Returns start
+        time shifted by the time spent on pause.
+        """
+        perf_counter: Callable[[], float] = time.perf_counter
+        while True:
+            if self.__interrupted:
+                if not self.__running:
+                    break
+                start_time = self.__wait_for_resume(start_time)
+                continue
+            remaining: float = start_time + event_time - perf_counter()
+            if 0 >= remaining:
+                break
+            milliseconds: int = int((remaining - SPIN_SECONDS) * 1_000)
+            if 0 < milliseconds:
+                self.__sleep(min(milliseconds, PROGRESS_MILLISECONDS))
+                self.__report_progress(perf_counter() - start_time)
+        return start_time
+
+    def __report_progress(self, position: float) -> None:
+        """Emit playback position, at most once per PROGRESS_SECONDS of playback."""
+        if PROGRESS_SECONDS <= position - self.__progress_time:
+            self.__progress_time = position
+            self.progress.emit(position)
+
+    def __sleep(self, milliseconds: int) -> None:
+        """Sleep on the pause condition unless a pause or stop request is already pending."""
+        with QMutexLocker(self.__pause_mutex):
+            if not self.__interrupted:
+                self.__pause_condition.wait(self.__pause_mutex, milliseconds)
+
+    def __build_handlers(self, synth: fluidsynth.Synth,
+                               chord_notes: list[int]) -> tuple[dict[str, NoteHandler], ChordFlush]:
+        """Build message type to note handler mapping and chord flush used by the playback loop.
+
+        Note-on messages are collected into the pending chord, keeping its maximum velocity
+        as they arrive, and the playback loop flushes the chord once all messages due at the
+        same time were handled. Callers check for pending notes before flushing. In audio
+        mode notes are struck and, on note-off messages, released right away through the
+        libfluidsynth prototypes bound to the synth handle and channel, skipping the
+        argument checks of `Synth.noteon` and `Synth.noteoff` (clipped MIDI data is always
+        in range). Note-off messages flush the pending chord first.
+        """
+        noteon: Callable[[int, int], int] = partial(fluidsynth.fluid_synth_noteon, synth.synth, 0)
+        noteoff: Callable[[int], int] = partial(fluidsynth.fluid_synth_noteoff, synth.synth, 0)
+        is_audio: bool = self.__is_audio
+        chord_velocity: int = 0
+
+        def flush_chord() -> None:
+            nonlocal chord_velocity
+            if is_audio:
                 for n in chord_notes:
-                    synth.noteon(0, n, chord_velocity)
-                synth.cc(0, 7, self.__volume)
+                    noteon(n, chord_velocity)
             else:
                 play_chord(chord_notes)
-        tick_events.clear()
+            chord_notes.clear()
+            chord_velocity = 0
+
+        def release_note(note: int, _velocity: int) -> None:
+            if chord_notes:
+                flush_chord()
+            noteoff(note)
+
+        def add_note(note: int, velocity: int) -> None:
+            nonlocal chord_velocity
+            chord_notes.append(note)
+            if velocity > chord_velocity:
+                chord_velocity = velocity
+
+        handlers: dict[str, NoteHandler] = {"note_on": add_note}
+        if is_audio:
+            handlers["note_off"] = release_note
+        return handlers, flush_chord
+
+    def __apply_volume(self, synth: fluidsynth.Synth) -> None:
+        """Send volume to synth only when it was changed since the last update."""
+        volume: int = self.__volume
+        if volume != self.__last_volume:
+            synth.cc(0, 7, volume)
+            self.__last_volume = volume
 
     @override
     def run(self) -> None:
-        """Worker body with proper chord grouping and tempo handling."""
+        """Worker body with proper chord grouping and tempo handling.
+
+        When the thread stalled and events are more than MAX_LAG_SECONDS overdue, their
+        note-on messages are skipped until playback is back on schedule, so the track
+        keeps its length instead of drifting behind the displayed duration. Note-off
+        messages are still sent, so no note is left ringing.
+        """
+        self.setPriority(QThread.Priority.TimeCriticalPriority)
         self.__error = False
         try:
-            player: mido.MidiFile = mido.MidiFile(self.__filename)
+            player: mido.MidiFile = mido.MidiFile(self.__filename, clip=True)
         except mido.midifiles.meta.KeySignatureError:
             self.__error = True
             return
-        synth: fluidsynth.Synth = fluidsynth.Synth()
+        QThreadPool.globalInstance().start(partial(self.__calculate_duration, player))
+        synth: fluidsynth.Synth = self.__synth
         if self.__is_audio:
-            synth.start(driver="dsound")
-            synth.program_select(0, synth.sfload(self.__soundfont), 0, 0)
-        tick_events: list[mido.Message] = []
-        start_time: float = time.perf_counter()
-        self.__calculate_duration()
-        for msg in player.play():
-            while self.__paused and self.__running:
-                time.sleep(0.05)
-            if not self.__running:
-                break
-            target: float = start_time + msg.time
-            while True:
-                now: float = time.perf_counter()
-                if now >= target:
-                    break
-                time.sleep(min(0.001, target - now))
-            if msg.type in ("note_on", "note_off"):
-                tick_events.append(msg)
-            self.__flush_tick_events(synth, tick_events)
-            if self.__is_audio:
-                synth.cc(0, 7, self.__volume)
-        self.__flush_tick_events(synth, tick_events)
-        synth.delete()
+            synth.program_select(0, self.__soundfont_id, 0, 0)
+            self.__last_volume = -1
+            self.__apply_volume(synth)
+        else:
+            resolve_scan_codes()
+        chord_notes: list[int] = []
+        handlers: dict[str, NoteHandler]
+        flush_chord: ChordFlush
+        handlers, flush_chord = self.__build_handlers(synth, chord_notes)
+        schedule: list[ScheduledEvent] = self.__build_schedule(player, handlers)
+        add_note: NoteHandler = handlers["note_on"]
+        wait_until: Callable[[float, float], float] = self.__wait_until
+        perf_counter: Callable[[], float] = time.perf_counter
+        apply_volume: Callable[[fluidsynth.Synth], None] = self.__apply_volume
+        report_progress: Callable[[float], None] = self.__report_progress
+        is_audio: bool = self.__is_audio
+        with timer_resolution(), pro_audio_thread():
+            start_time: float = time.perf_counter()
+            if not is_audio:
+                start_time += WWM_LEAD_IN_SECONDS
+            chord_time: float = -1.0
+            self.__progress_time = 0.0
+            overdue: bool = False
+            for event_time, handler, note, velocity in schedule:
+                if event_time != chord_time:
+                    if chord_notes:
+                        flush_chord()
+                    start_time = wait_until(start_time, event_time)
+                    if not self.__running:
+                        break
+                    overdue = MAX_LAG_SECONDS < perf_counter() - start_time - event_time
+                    if is_audio:
+                        apply_volume(synth)
+                    report_progress(event_time)
+                    chord_time = event_time
+                if overdue and handler is add_note:
+                    continue
+                handler(note, velocity)
+            if chord_notes:
+                flush_chord()
+        if self.__is_audio:
+            synth.system_reset()
 
     def stop(self) -> None:
         """Stop worker."""
-        self.__running = False
+        with QMutexLocker(self.__pause_mutex):
+            self.__running = False
+            self.__interrupted = True
+            self.__pause_condition.wakeAll()
 
     def toggle_pause(self) -> None:
         """Pause worker."""
-        self.__paused = not self.__paused
+        with QMutexLocker(self.__pause_mutex):
+            self.__paused = not self.__paused
+            self.__interrupted = self.__paused or not self.__running
+            self.__pause_condition.wakeAll()
 
     def set_volume(self, volume: int) -> None:
         """Set synth volume."""
@@ -205,64 +363,123 @@ class Player(QMainWindow):
         screen_size: QRect = QGuiApplication.primaryScreen().availableGeometry()
         self.setMinimumSize(QSize(screen_size.width() // 2, screen_size.height() // 2))
         self.__files: list[str] = []
+        self.__file_names: list[str] = []
         self.__current_index: int = -1
         self.__thread: Worker|None = None
         self.__soundfont: str = "GeneralUser.sf2"
+        self.__synth: fluidsynth.Synth = fluidsynth.Synth()
+        self.__synth.start(driver="dsound")
+        self.__soundfont_id: int = self.__synth.sfload(self.__soundfont)
         self.__file: QLabel = QLabel("No files loaded")
         self.__playlist: PlayList = PlayList()
         self.__playlist.itemDoubleClicked.connect(self.__playlist_on_double_click)
-        self.__play: PlayButton
+        self.__play: PlayButton = PlayButton()
         self.__progressbar: ProgressBar = ProgressBar()
         self.__mode_toggle: ToggleSwitch = ToggleSwitch()
         self.__current_time: QLabel = QLabel("00:00")
         self.__duration_time: QLabel = QLabel("00:00")
-        self.__current: int = 0
         self.__duration: int = 0
-        self.__progress_timer: QTimer
+        self.__shown_progress: int = 0
+        self.__volume: int = 100
+        self.__volume_timer: QTimer = QTimer(self)
+        self.__volume_timer.setSingleShot(True)
+        self.__volume_timer.setInterval(10)
+        self.__volume_timer.timeout.connect(self.__flush_volume)
+        self.__previous_action: QAction = self.__construct_action("Previous",
+                                                                  self.__previous_on_click)
+        self.__play_action: QAction = self.__construct_action("Play/Pause", self.__play_on_click)
+        self.__next_action: QAction = self.__construct_action("Next", self.__next_on_click)
         self.__construct_menu_bar()
         self.__construct_layout()
         self.__bind_shortcuts()
 
+    @override
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Stop playback, release global hotkeys and synthesizer on close."""
+        if self.__thread and self.__thread.isRunning():
+            self.__thread.stop()
+            self.__thread.wait()
+        keyboard.unhook_all_hotkeys()
+        self.__synth.delete()
+        super().closeEvent(event)
+
     @staticmethod
     def __convert_to_mm_ss(seconds: int) -> tuple[int, int]:
         """Convert seconds to humane format MM:SS."""
         return divmod(seconds, 60)
 
     def __bind_shortcuts(self) -> None:
-        """Bind shortcuts."""
-        keyboard.add_hotkey("f9", self.__previous_on_click)
-        keyboard.add_hotkey("f10", self.__play_on_click)
-        keyboard.add_hotkey("f11", self.__next_on_click)
-        keyboard.add_hotkey("f8", self.__mode_toggle.toggle)
+        """Bind global shortcuts.
+
+        Hotkeys stay global, so they work while the game window has focus. Their callbacks
+        run on the keyboard hook thread, so they only queue the matching slot for the GUI
+        thread and return right away.
+        """
+        shortcuts: tuple[tuple[str, QObject, str], ...] = (
+            ("f9", self.__previous_action, "trigger"),
+            ("f10", self.__play_action, "trigger"),
+            ("f11", self.__next_action, "trigger"),
+            ("f8", self.__mode_toggle, "toggle"),
+        )
+        for hotkey, receiver, slot in shortcuts:
+            keyboard.add_hotkey(hotkey, partial(QMetaObject.invokeMethod, receiver, slot,
+                                                Qt.ConnectionType.QueuedConnection))
 
     @Slot(float)
     def __duration_ready(self, duration: float) -> None:
-        """Set duration and start timer."""
-        self.__current = 0
-        self.__duration = int(duration)
-        minutes, seconds = self.__convert_to_mm_ss(self.__duration)
+        """Set duration, keeping the progress already shown.
+
+        Duration is calculated on the thread pool while the track is already playing, so
+        a late result of a replaced worker is ignored.
+        """
+        if self.sender() is not self.__thread:
+            return
+        self.__show_duration(int(duration))
+        self.__progressbar.setValue(min(self.__shown_progress, self.__duration))
+
+    def __show_duration(self, duration: int) -> None:
+        """Show track duration in seconds, zero while it is not known yet.
+
+        The bar keeps a non-empty range, so it stays empty rather than busy while the
+        duration is unknown.
+        """
+        self.__duration = duration
+        minutes, seconds = self.__convert_to_mm_ss(duration)
         self.__duration_time.setText(f"{minutes}:{seconds:02d}")
-        self.__progressbar.setMaximum(self.__duration)
-        try:
-            self.__progress_timer.stop()
-        except AttributeError:
-            ...
-        self.__progress_timer = QTimer(self)
-        self.__progress_timer.timeout.connect(self.__update_progress)
-        self.__progress_timer.start(1_000)
+        self.__progressbar.setMaximum(max(1, duration))
 
-    @Slot()
-    def __update_progress(self) -> None:
-        """Update progress."""
-        if self.__thread and self.__thread.paused:
+    @Slot(float)
+    def __update_progress(self, position: float) -> None:
+        """Update progress from playback position reported by the current worker."""
+        if self.sender() is self.__thread:
+            current: int = int(position)
+            if self.__duration:
+                current = min(current, self.__duration)
+            self.__show_progress(current)
+
+    def __show_progress(self, current: int) -> None:
+        """Show current playback position in seconds, unless it is already shown.
+
+        Progress is reported several times per second, but the label and the bar only
+        change once per second.
+        """
+        if current == self.__shown_progress:
             return
-        self.__progressbar.setValue(self.__current)
-        minutes, seconds = self.__convert_to_mm_ss(self.__current)
+        self.__shown_progress = current
+        self.__progressbar.setValue(current)
+        minutes, seconds = self.__convert_to_mm_ss(current)
         self.__current_time.setText(f"{minutes}:{seconds:02d}")
-        if self.__current >= self.__duration:
-            self.__progress_timer.stop()
-            return
-        self.__current += 1
+
+    @Slot()
+    def __worker_finished(self) -> None:
+        """Release play button and complete progress once the current worker finished.
+
+        Finished signal of a replaced worker is delivered after the new one started,
+        so it is ignored.
+        """
+        if self.sender() is self.__thread:
+            self.__play.setChecked(False)
+            self.__show_progress(self.__duration)
 
     def __start_playback(self) -> None:
         """Start playback."""
@@ -272,22 +489,36 @@ class Player(QMainWindow):
         self.__play.setChecked(True)
         self.__playlist.setCurrentRow(self.__current_index)
         is_audio: bool = self.__mode_toggle.isChecked()
-        self.__thread = Worker(self.__files[self.__current_index], self.__soundfont, is_audio)
+        self.__thread = Worker(self.__files[self.__current_index], self.__synth,
+                               self.__soundfont_id, is_audio)
+        self.__thread.set_volume(self.__volume)
+        self.__show_duration(0)
+        self.__show_progress(0)
         self.__thread.duration_ready.connect(self.__duration_ready)
-        self.__thread.finished.connect(lambda: self.__play.setChecked(False))
-        if not is_audio:
-            time.sleep(1)
+        self.__thread.progress.connect(self.__update_progress)
+        self.__thread.finished.connect(self.__worker_finished)
         self.__thread.start()
         if self.__thread.error:
             self.__file.setText("Invalid file. Please select another one.")
         else:
-            self.__file.setText(self.__playlist.currentItem().text())
+            self.__file.setText(self.__file_names[self.__current_index])
 
     def __playlist_on_double_click(self, item: QListWidgetItem) -> None:
         """Play track when double-clicked in playlist."""
         self.__current_index = self.__playlist.row(item)
         self.__start_playback()
 
+    def __populate_playlist(self) -> None:
+        """Fill playlist widget with loaded files in a single batch.
+
+        Display names are computed once here and kept parallel to `__files`.
+        """
+        self.__file_names = [os.path.basename(path) for path in self.__files]
+        self.__playlist.setUpdatesEnabled(False)
+        self.__playlist.clear()
+        self.__playlist.addItems(self.__file_names)
+        self.__playlist.setUpdatesEnabled(True)
+
     def __save_playlist(self) -> None:
         """Save playlist to file."""
         filename, _ = QFileDialog.getSaveFileName(self, "Save Playlist", "", "Playlist (*.m3u)")
@@ -303,10 +534,8 @@ class Player(QMainWindow):
         if not filename:
             return
         with open(filename, encoding="utf-8") as f:
-            self.__files = [line.strip() for line in f if line.strip()]
-        self.__playlist.clear()
-        for path in self.__files:
-            self.__playlist.addItem(os.path.basename(path))
+            self.__files = [path for line in f if (path := line.strip())]
+        self.__populate_playlist()
         self.__current_index = 0
         self.__file.setText(f"Loaded playlist with {len(self.__files)} files.")
 
@@ -318,9 +547,7 @@ class Player(QMainWindow):
             return
         self.__files = files
         self.__current_index = 0
-        self.__playlist.clear()
-        for f in files:
-            self.__playlist.addItem(os.path.basename(f))
+        self.__populate_playlist()
         self.__file.setText(f"Loaded {len(files)} files. Ready to play.")
 
     def __previous_on_click(self) -> None:
@@ -348,37 +575,42 @@ class Player(QMainWindow):
             self.__start_playback()
 
     def __set_volume(self, value: int) -> None:
-        """Adjust FluidSynth volume gain."""
+        """Adjust FluidSynth volume gain.
+
+        Slider drags are coalesced, only the last value is pushed once the timer fires.
+        """
+        self.__volume = value
+        self.__volume_timer.start()
+
+    @Slot()
+    def __flush_volume(self) -> None:
+        """Push pending volume to the worker."""
         if self.__thread and self.__thread.isRunning():
-            self.__thread.set_volume(value)
+            self.__thread.set_volume(self.__volume)
 
     def __show_about(self):
         QMessageBox.information(self, "About",
                                 "Windows MIDI Player for WWM\nBuilt with PySide6 + FluidSynth")
 
-    def __construct_button(self, text: str, callback: Callable, key: str="") -> QVBoxLayout:
-        """Construct button."""
+    def __construct_action(self, text: str, callback: Callable) -> QAction:
+        """Construct action shared by the menu and the control buttons."""
+        action: QAction = QAction(text, self)
+        action.triggered.connect(callback)
+        return action
+
+    def __construct_button(self, button: QPushButton, callback: Callable,
+                                 key: str="") -> QVBoxLayout:
+        """Construct button layout with an optional shortcut hint below it."""
         layout: QVBoxLayout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
-        button: QPushButton
-        if "Next" == text:
-            button = NextButton()
-        elif "Previous" == text:
-            button = PreviousButton()
-        elif "Play" == text:
-            button = PlayButton()
-            self.__play = button
-        else:
-           button = QPushButton(text)
         button.clicked.connect(callback)
         layout.addWidget(button, alignment=Qt.AlignmentFlag.AlignCenter)
         if key:
             layout.addWidget(QLabel(f"[{key}]"), alignment=Qt.AlignmentFlag.AlignCenter)
         return layout
 
-    def __construct_file_menu(self) -> None:
+    def __construct_file_menu(self, menu_bar: QMenuBar) -> None:
         """Construct file menu."""
-        menu_bar: QMenuBar = self.menuBar()
         menu: QMenu = menu_bar.addMenu("&File")
         open_action: QAction = QAction("Open MIDI file", self)
         save_action: QAction = QAction("Save Playlist", self)
@@ -393,23 +625,15 @@ class Player(QMainWindow):
         menu.addAction(load_action)
         menu.addAction(exit_action)
 
-    def __construct_playback_menu(self) -> None:
+    def __construct_playback_menu(self, menu_bar: QMenuBar) -> None:
         """Construct playback menu."""
-        menu_bar: QMenuBar = self.menuBar()
         menu: QMenu = menu_bar.addMenu("&Playback")
-        previous_action: QAction = QAction("Previous", self)
-        play_action: QAction = QAction("Play/Pause", self)
-        next_action: QAction = QAction("Next", self)
-        previous_action.triggered.connect(self.__previous_on_click)
-        play_action.triggered.connect(self.__play_on_click)
-        next_action.triggered.connect(self.__next_on_click)
-        menu.addAction(previous_action)
-        menu.addAction(play_action)
-        menu.addAction(next_action)
-
-    def __construct_help_menu(self) -> None:
+        menu.addAction(self.__previous_action)
+        menu.addAction(self.__play_action)
+        menu.addAction(self.__next_action)
+
+    def __construct_help_menu(self, menu_bar: QMenuBar) -> None:
         """Construct help menu."""
-        menu_bar: QMenuBar = self.menuBar()
         menu: QMenu = menu_bar.addMenu("&Help")
         about_action: QAction = QAction("About", self)
         about_action.triggered.connect(self.__show_about)
@@ -417,9 +641,10 @@ class Player(QMainWindow):
 
     def __construct_menu_bar(self) -> None:
         """Construct menu bar."""
-        self.__construct_file_menu()
-        self.__construct_playback_menu()
-        self.__construct_help_menu()
+        menu_bar: QMenuBar = self.menuBar()
+        self.__construct_file_menu(menu_bar)
+        self.__construct_playback_menu(menu_bar)
+        self.__construct_help_menu(menu_bar)
 
     def __construct_volume_slider(self) -> QHBoxLayout:
         """Construct volume slider."""
@@ -462,17 +687,18 @@ class Player(QMainWindow):
         widget: QWidget = QWidget()
         layout: QHBoxLayout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addLayout(self.__construct_button("Previous", self.__previous_on_click, key="F9"))
-        layout.addLayout(self.__construct_button("Play", self.__play_on_click, key="F10"))
-        layout.addLayout(self.__construct_button("Next", self.__next_on_click, key="F11"))
+        layout.addLayout(self.__construct_button(PreviousButton(), self.__previous_action.trigger,
+                                                 key="F9"))
+        layout.addLayout(self.__construct_button(self.__play, self.__play_action.trigger,
+                                                 key="F10"))
+        layout.addLayout(self.__construct_button(NextButton(), self.__next_action.trigger,
+                                                 key="F11"))
         grid.addWidget(self.__file, 0, 0,
                         alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         grid.addWidget(widget, 0, 1, alignment=Qt.AlignmentFlag.AlignCenter)
         grid.addWidget(self.__construct_helpers(), 0, 2, alignment=Qt.AlignmentFlag.AlignRight)
-        columns_count: int = grid.columnCount()
-        column_width: int = self.width() // columns_count
-        for column in range(columns_count):
-            grid.setColumnMinimumWidth(column, column_width)
+        for column in range(grid.columnCount()):
+            grid.setColumnStretch(column, 1)
         return grid
 
     def __construct_layout(self) -> None:
@@ -486,6 +712,7 @@ class Player(QMainWindow):
 
 if __name__ == "__main__":
     app: QApplication = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLE_SHEET)
     window: Player = Player()
     window.show()
     sys.exit(app.exec())
@@ -1,11 +1,17 @@
 """Abstract Button widget."""
 
 
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QRect, QSize, Qt
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QPushButton, QWidget
 from src.utils.common import Colors
 
+STYLE_SHEET: str = """
+    AbstractButton {
+        background: none;
+        border: none;
+    }
+"""
 
 class AbstractButton(QPushButton):
     """Abstract Button widget."""
@@ -16,16 +22,7 @@ class AbstractButton(QPushButton):
         self.setFixedSize(QSize(40, 30))
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._color: QColor = Colors.ACCENT_1.value.qcolor
-        self.set_style()
-
-    def set_style(self) -> None:
-        """Override size hint."""
-        self.setStyleSheet("""
-            QPushButton {
-                background: none;
-                border: none;
-            }
-        """)
+        self._icon_rect: QRect = self.rect().adjusted(10, 8, -10, -8)
 
 if "__main__" == __name__:
     ...
@@ -16,26 +16,29 @@ class PlayButton(AbstractButton):
         super().__init__(parent=parent)
         self.setCheckable(True)
         self.setChecked(False)
+        rect: QRect = self._icon_rect
+        bar_width: int = rect.width() // 3
+        self.__triangle: QPolygon = QPolygon([QPoint(rect.left(), rect.top()),
+                                              QPoint(rect.right(), rect.center().y()),
+                                              QPoint(rect.left(), rect.bottom())])
+        self.__bars: tuple[QRect, QRect] = (
+            QRect(rect.left(), rect.top(), bar_width, rect.height()),
+            QRect(rect.right() - bar_width, rect.top(), bar_width, rect.height()),
+        )
 
     @override
-    def paintEvent(self, event: QPaintEvent) -> None:
+    def paintEvent(self, _event: QPaintEvent) -> None:
         """Override paint event."""
         painter: QPainter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setBrush(self._color)
         painter.setPen(Qt.PenStyle.NoPen)
-        rect: QRect = self.rect().adjusted(10, 8, -10, -8)
         if self.isChecked():
-            bar_width: int = rect.width() // 3
-            painter.drawRect(QRect(rect.left(), rect.top(), bar_width, rect.height()))
-            painter.drawRect(QRect(rect.right() - bar_width, rect.top(), bar_width, rect.height()))
+            for bar in self.__bars:
+                painter.drawRect(bar)
         else:
-            points: list[QPoint] = [QPoint(rect.left(), rect.top()),
-                                    QPoint(rect.right(), rect.center().y()),
-                                    QPoint(rect.left(), rect.bottom())]
-            painter.drawPolygon(QPolygon(points))
+            painter.drawPolygon(self.__triangle)
         painter.end()
-        return super().paintEvent(event)
 
 if "__main__" == __name__:
     ...
@@ -14,22 +14,22 @@ class PreviousButton(AbstractButton):
     def __init__(self, parent: QWidget|None=None) -> None:
         """Initialize Previous Button widget."""
         super().__init__(parent=parent)
+        rect: QRect = self._icon_rect
+        self.__triangle: QPolygon = QPolygon([QPoint(rect.right(), rect.top()),
+                                              QPoint(rect.left() + 6, rect.center().y()),
+                                              QPoint(rect.right(), rect.bottom())])
+        self.__bar: QRect = QRect(rect.left() + 2, rect.top(), 3, rect.height())
 
     @override
-    def paintEvent(self, event: QPaintEvent) -> None:
+    def paintEvent(self, _event: QPaintEvent) -> None:
         """Override paint event."""
         painter: QPainter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setBrush(self._color)
         painter.setPen(Qt.PenStyle.NoPen)
-        rect: QRect = self.rect().adjusted(10, 8, -10, -8)
-        points: list[QPoint] = [QPoint(rect.right(), rect.top()),
-                                QPoint(rect.left() + 6, rect.center().y()),
-                                QPoint(rect.right(), rect.bottom())]
-        painter.drawPolygon(QPolygon(points))
-        painter.drawRect(QRect(rect.left() + 2, rect.top(), 3, rect.height()))
+        painter.drawPolygon(self.__triangle)
+        painter.drawRect(self.__bar)
         painter.end()
-        return super().paintEvent(event)
 
 if "__main__" == __name__:
     ...
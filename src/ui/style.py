@@ -0,0 +1,18 @@
+"""Application wide style sheet."""
+
+from src.ui.buttons.abstract import STYLE_SHEET as BUTTON_STYLE_SHEET
+from src.ui.playlist import STYLE_SHEET as PLAYLIST_STYLE_SHEET
+from src.ui.progressbar import STYLE_SHEET as PROGRESSBAR_STYLE_SHEET
+from src.ui.toggle_switch import STYLE_SHEET as TOGGLE_SWITCH_STYLE_SHEET
+from src.ui.volume_slider import STYLE_SHEET as VOLUME_STYLE_SHEET
+
+APP_STYLE_SHEET: str = "".join((
+    BUTTON_STYLE_SHEET,
+    PLAYLIST_STYLE_SHEET,
+    PROGRESSBAR_STYLE_SHEET,
+    TOGGLE_SWITCH_STYLE_SHEET,
+    VOLUME_STYLE_SHEET,
+))
+
+if "__main__" == __name__:
+    ...
@@ -3,10 +3,15 @@
 from typing import override
 
 from PySide6.QtCore import QRect, QSize, Qt
-from PySide6.QtGui import QColor, QPainter, QPaintEvent
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPixmap, QResizeEvent
 from PySide6.QtWidgets import QCheckBox, QWidget
 from src.utils.common import Colors
 
+STYLE_SHEET: str = """
+    ToggleSwitch {
+        spacing: 8px;
+    }
+"""
 
 class ToggleSwitch(QCheckBox):
     """Modern Toggle Switch in WWM style."""
@@ -20,36 +25,56 @@ class ToggleSwitch(QCheckBox):
         self.__knob_color: QColor = QColor("#FFFFFF")
         self.__knob_size: int = 18
         self.__knob_offset: int = 2
+        self.__pixmaps: dict[tuple[bool, float], QPixmap] = {}
         self.setChecked(False)
-        self.setStyleSheet("""
-            QCheckBox {
-                spacing: 8px;
-            }
-        """)
 
     @override
     def sizeHint(self) -> QSize:
         """Override size hint."""
         return QSize(40, 25)
 
+    @override
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Override resize event, drop pixmaps rendered for the previous size."""
+        self.__pixmaps.clear()
+        super().resizeEvent(event)
+
     @override
     def paintEvent(self, _event: QPaintEvent) -> None:
-        """Override paint event."""
+        """Override paint event, blit the pixmap rendered for current state and screen.
+
+        Pixmaps are keyed by device pixel ratio as well, so moving the window to a screen
+        with another scale factor renders sharp ones instead of scaling the old ones.
+        """
+        key: tuple[bool, float] = (self.isChecked(), self.devicePixelRatioF())
+        pixmap: QPixmap|None = self.__pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self.__pixmaps[key] = self.__render(*key)
         painter: QPainter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+
+    def __render(self, checked: bool, ratio: float) -> QPixmap:
+        """Render switch in given state into a pixmap of the widget size at given ratio."""
+        pixmap: QPixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter: QPainter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         track_rect: QRect = QRect(0, 0, self.width(), self.height())
-        painter.setBrush(self.__checked_color if self.isChecked() else self.__unchecked_color)
+        painter.setBrush(self.__checked_color if checked else self.__unchecked_color)
         painter.setPen(Qt.PenStyle.NoPen)
         radius: int = self.height() // 2
         painter.drawRoundedRect(track_rect, radius, radius)
         knob_x: int = self.__knob_offset
-        if self.isChecked():
+        if checked:
             knob_x = self.width() - self.__knob_size - self.__knob_offset
         knob_rect: QRect = QRect(knob_x, ((self.height() // 2) - (self.__knob_size // 2)),
                                  self.__knob_size, self.__knob_size)
         painter.setBrush(self.__knob_color)
         painter.drawEllipse(knob_rect)
         painter.end()
+        return pixmap
 
 if "__main__" == __name__:
     ...
@@ -4,6 +4,29 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QSlider, QWidget
 from src.utils.common import Colors
 
+STYLE_SHEET: str = f"""
+    Volume::groove:horizontal {{
+        background: {Colors.BACKGROUND.value.hex};
+        border: 1px solid {Colors.ACCENT_2.value.hex};
+        border-radius: 4px;
+        height: 8px;
+    }}
+    Volume::handle:horizontal {{
+        background: {Colors.ACCENT_1.value.hex};
+        border: 1px solid #C0A060;
+        border-radius: 8px;
+        width: 16px;
+        height: 16px;
+        margin: -4px 0;
+    }}
+    Volume::handle:horizontal:hover {{
+        background: #C0A060;
+    }}
+    Volume::sub-page:horizontal {{
+        background: {Colors.ACCENT_1.value.hex};
+        border-radius: 4px;
+    }}
+"""
 
 class Volume(QSlider):
     """Volume slider widget.."""
@@ -14,33 +37,6 @@ class Volume(QSlider):
         self.setOrientation(Qt.Orientation.Horizontal)
         self.setRange(0, 127)
         self.setValue(100)
-        self.set_style()
-
-    def set_style(self) -> None:
-        """Override size hint."""
-        self.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                background: {Colors.BACKGROUND.value.hex};
-                border: 1px solid {Colors.ACCENT_2.value.hex};
-                border-radius: 4px;
-                height: 8px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {Colors.ACCENT_1.value.hex};
-                border: 1px solid #C0A060;
-                border-radius: 8px;
-                width: 16px;
-                height: 16px;
-                margin: -4px 0;
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: #C0A060;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {Colors.ACCENT_1.value.hex};
-                border-radius: 4px;
-            }}
-        """)
 
 if "__main__" == __name__:
     ...
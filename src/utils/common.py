@@ -1,7 +1,8 @@
 """Common functionality used by different modules."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 
 from PySide6.QtGui import QColor
 
@@ -11,13 +12,16 @@ class Color:
     """Color representation class."""
 
     hex: str = "#000000"
-    qcolor: QColor  = field(init=False)
 
     def __post_init__(self) -> None:
         """Post initialization calcultion."""
         if not self.hex.startswith("#"):
             self.hex = "#" + self.hex
-        self.qcolor = QColor(self.hex)
+
+    @cached_property
+    def qcolor(self) -> QColor:
+        """Return QColor of this color, constructed on first access only."""
+        return QColor(self.hex)
 
 class Colors(Enum):
     """Global colors enumeration."""
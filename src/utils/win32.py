@@ -0,0 +1,50 @@
+"""Windows specific helpers for precise playback timing."""
+
+import ctypes
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+IS_WINDOWS: bool = "win32" == sys.platform
+
+@contextmanager
+def timer_resolution(period_ms: int=1) -> Iterator[None]:
+    """Raise system timer resolution while inside the context.
+
+    Default Windows timer granularity is ~15.6 ms, which makes `time.sleep` far too coarse
+    for note scheduling. Does nothing on other platforms.
+    """
+    if not IS_WINDOWS:
+        yield
+        return
+    winmm: ctypes.WinDLL = ctypes.windll.winmm
+    winmm.timeBeginPeriod(period_ms)
+    try:
+        yield
+    finally:
+        winmm.timeEndPeriod(period_ms)
+
+@contextmanager
+def pro_audio_thread() -> Iterator[None]:
+    """Register calling thread with the MMCSS "Pro Audio" task while inside the context.
+
+    Multimedia Class Scheduler boosts registered threads so playback is not starved by
+    other processes. Does nothing on other platforms or when avrt.dll is unavailable.
+    """
+    if not IS_WINDOWS:
+        yield
+        return
+    try:
+        avrt: ctypes.WinDLL = ctypes.windll.avrt
+    except OSError:
+        yield
+        return
+    avrt.AvSetMmThreadCharacteristicsW.restype = ctypes.c_void_p
+    avrt.AvRevertMmThreadCharacteristics.argtypes = [ctypes.c_void_p]
+    task_index: ctypes.c_ulong = ctypes.c_ulong(0)
+    handle: int|None = avrt.AvSetMmThreadCharacteristicsW("Pro Audio", ctypes.byref(task_index))
+    try:
+        yield
+    finally:
+        if handle:
+            avrt.AvRevertMmThreadCharacteristics(handle)
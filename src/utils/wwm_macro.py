@@ -47,6 +47,7 @@ BASE_NOTES: dict[str, int] = {
     "med": 60,   # C4
     "high": 72,  # C5
 }
+MIDI_NOTE_COUNT: int = 128
 
 class Note(IntEnum):
     """Note information enumeration."""
@@ -70,19 +71,84 @@ def __build_map() -> dict[int, str]:
 NOTE_TO_WWM_KEY: dict[int, str] = __build_map()
 
 def __transpose_into_range(note: int) -> int:
-    """Fold note into [48, 83] by octaves to reach playable range."""
-    while note < Note.MIN:
-        note += Note.OFFSET
-    while note > Note.MAX:
-        note -= Note.OFFSET
+    """Fold note into [48, 83] by octaves to reach playable range.
+
+    Notes below the range land in its lowest octave and notes above it in its highest
+    one, keeping the pitch class, which is what repeated octave shifts would produce.
+    """
+    if note < Note.MIN:
+        return Note.MIN + (note - Note.MIN) % Note.OFFSET
+    if note > Note.MAX:
+        return Note.MAX - (Note.MAX - note) % Note.OFFSET
     return note
 
+def __build_midi_map() -> tuple[str, ...]:
+    """Construct MIDI_TO_WWM_KEY, lowercase key of every MIDI note folded into range."""
+    return tuple(NOTE_TO_WWM_KEY.get(__transpose_into_range(note), "").lower()
+                 for note in range(MIDI_NOTE_COUNT))
+
+MIDI_TO_WWM_KEY: tuple[str, ...] = __build_midi_map()
+
+MIDI_TO_SCAN_CODES: tuple[tuple[int, ...], ...] = ((),) * MIDI_NOTE_COUNT
+
+def __resolve_scan_codes(key: str) -> tuple[int, ...]:
+    """Return scan codes of WWM key combination, empty when it cannot be resolved.
+
+    Combinations are single-step (modifier plus key), so the first scan code of each key
+    in the step is kept, in press order, the same way `keyboard.send` picks them. Keys
+    missing from the current layout, or a failing keyboard backend, leave the key
+    unresolved, so it is sent by name instead.
+    """
+    try:
+        return tuple(scan_codes[0] for step in keyboard.parse_hotkey(key)
+                     for scan_codes in step)
+    except Exception:
+        return ()
+
+def resolve_scan_codes() -> None:
+    """Resolve MIDI_TO_SCAN_CODES for current keyboard layout, every distinct key once.
+
+    Called when WWM playback starts rather than at import, so a layout switched since
+    the previous track is picked up and audio mode never resolves keys at all.
+    """
+    global MIDI_TO_SCAN_CODES
+    resolved: dict[str, tuple[int, ...]] = {"": ()}
+    for key in MIDI_TO_WWM_KEY:
+        if key not in resolved:
+            resolved[key] = __resolve_scan_codes(key)
+    MIDI_TO_SCAN_CODES = tuple(resolved[key] for key in MIDI_TO_WWM_KEY)
+
 def play_note(note: int) -> None:
-    """Play note."""
-    if key := NOTE_TO_WWM_KEY.get(__transpose_into_range(note)):
-        keyboard.send(key.lower())
+    """Play MIDI note by its resolved scan codes, or by key name when it is unresolved."""
+    scan_codes: tuple[int, ...] = MIDI_TO_SCAN_CODES[note]
+    if not scan_codes:
+        if key := MIDI_TO_WWM_KEY[note]:
+            keyboard.send(key)
+        return
+    for scan_code in scan_codes:
+        keyboard.press(scan_code)
+    for scan_code in reversed(scan_codes):
+        keyboard.release(scan_code)
 
 def play_chord(notes: list[int]) -> None:
-    """Play chord."""
+    """Play chord, pressing all of its plain keys together in one round.
+
+    Keys with modifiers, and unresolved keys sent by name, are played one by one after
+    the plain keys are released, since a held modifier would change every other key
+    pressed along with it. Unmapped notes are skipped.
+    """
+    plain_keys: list[int] = []
+    single_notes: list[int] = []
     for n in notes:
+        scan_codes: tuple[int, ...] = MIDI_TO_SCAN_CODES[n]
+        if 1 == len(scan_codes):
+            plain_keys.extend(scan_codes)
+        elif 1 < len(scan_codes) or MIDI_TO_WWM_KEY[n]:
+            single_notes.append(n)
+    plain_keys = list(dict.fromkeys(plain_keys))
+    for scan_code in plain_keys:
+        keyboard.press(scan_code)
+    for scan_code in reversed(plain_keys):
+        keyboard.release(scan_code)
+    for n in single_notes:
         play_note(n)